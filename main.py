@@ -18,8 +18,7 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from site_monitor.bot import create_bot, SiteMonitorBot
-from site_monitor.config import load_config, create_sample_config
+from site_monitor.config import create_sample_config
 
 
 def main():
@@ -90,6 +89,9 @@ Examples:
         sys.exit(1)
 
     try:
+        # Imported here so --init doesn't load the monitoring stack
+        from site_monitor.bot import create_bot
+
         # Create bot
         bot = create_bot(args.config)
 
@@ -105,6 +107,7 @@ Examples:
             bot.show_history(args.history)
         elif args.once:
             bot.run_once()
+            bot.close()
         else:
             bot.run()
 
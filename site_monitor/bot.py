@@ -1,21 +1,24 @@
 """Main bot runner for site monitoring."""
 
+import concurrent.futures
+import heapq
 import logging
 import signal
 import sys
+import threading
 import time
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional
 
-import schedule
-
-from .monitor import SiteMonitor, SiteConfig
+from .monitor import SiteMonitor, SiteConfig, RawPage
 from .config import Config, load_config
 from .notifier import (
     NotificationManager,
     ConsoleNotifier,
     WebhookNotifier,
-    EmailNotifier
+    EmailNotifier,
+    BatchingEmailNotifier
 )
 
 logger = logging.getLogger(__name__)
@@ -26,9 +29,21 @@ class SiteMonitorBot:
 
     def __init__(self, config: Config):
         self.config = config
-        self.monitor = SiteMonitor(data_dir=config.settings.data_dir)
+        self.monitor = SiteMonitor(
+            data_dir=config.settings.data_dir,
+            fsync=config.settings.fsync
+        )
         self.notification_manager = NotificationManager()
         self.running = False
+        self._stop_event = threading.Event()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(32, len(config.sites)))
+        )
+        # One lock per site so the same site is never checked twice at once
+        self._site_locks = {site.name: threading.Lock() for site in config.sites}
+        # Latest submitted check per site, and when it was submitted
+        self._pending: dict[str, concurrent.futures.Future] = {}
+        self._last_start: dict[str, float] = {}
         self._setup_notifiers()
         self._setup_logging()
 
@@ -54,17 +69,29 @@ class SiteMonitorBot:
             logger.info("Webhook notifications enabled")
 
         # Add email notifier if configured
-        if self.config.settings.email:
-            self.notification_manager.add_notifier(
-                EmailNotifier(self.config.settings.email)
-            )
-            logger.info("Email notifications enabled")
+        email = self.config.settings.email
+        if email:
+            if email.batch_window > 0:
+                self.notification_manager.add_notifier(
+                    BatchingEmailNotifier(email, window=email.batch_window,
+                                          max_alerts=email.batch_max)
+                )
+                logger.info(f"Email notifications enabled (batched every {email.batch_window}s)")
+            else:
+                self.notification_manager.add_notifier(EmailNotifier(email))
+                logger.info("Email notifications enabled")
 
-    def check_site(self, site: SiteConfig):
+    def _get_interval(self, site: SiteConfig) -> int:
+        """Get the check interval for a site in seconds."""
+        return site.interval or self.config.settings.check_interval
+
+    def check_site(self, site: SiteConfig, page: Optional[RawPage] = None):
         """Check a single site for changes."""
         try:
             logger.debug(f"Checking {site.name}...")
-            change = self.monitor.check_site(site)
+            lock = self._site_locks.setdefault(site.name, threading.Lock())
+            with lock:
+                change = self.monitor.check_site(site, page)
 
             if change:
                 logger.info(f"Change detected on {site.name}")
@@ -75,26 +102,71 @@ class SiteMonitorBot:
         except Exception as e:
             logger.error(f"Error checking {site.name}: {e}")
 
+    def check_group(self, sites: list[SiteConfig]):
+        """Check sites that share a URL and headers, fetching the page only once."""
+        if len(sites) == 1:
+            self.check_site(sites[0])
+            return
+
+        try:
+            page = self.monitor.fetch_page(sites)
+        except Exception as e:
+            for site in sites:
+                logger.error(f"Error checking {site.name}: {e}")
+            return
+
+        for site in sites:
+            self.check_site(site, page)
+
+    def _group_sites(self, sites: list[SiteConfig]) -> list[list[SiteConfig]]:
+        """Group sites by URL and headers."""
+        groups = defaultdict(list)
+        for site in sites:
+            groups[(site.url, frozenset(site.headers.items()))].append(site)
+        return list(groups.values())
+
     def check_all_sites(self):
         """Check all configured sites."""
         logger.info(f"Running check on {len(self.config.sites)} site(s)...")
-        for site in self.config.sites:
-            self.check_site(site)
+        futures = [self._submit(group) for group in self._group_sites(self.config.sites)]
+        _, not_done = concurrent.futures.wait(futures, timeout=self.config.settings.check_interval)
+        if not_done:
+            logger.warning(f"{len(not_done)} site check(s) still running after "
+                           f"{self.config.settings.check_interval}s")
+
+    def _submit(self, sites: list[SiteConfig]) -> concurrent.futures.Future:
+        """Submit a group of sites sharing one page to the worker pool."""
+        future = self._executor.submit(self.check_group, sites)
+        now = time.monotonic()
+        for site in sites:
+            self._last_start[site.name] = now
+            self._pending[site.name] = future
+        return future
+
+    def _is_running(self, site: SiteConfig) -> bool:
+        """Whether the previous check of a site has not finished yet."""
+        future = self._pending.get(site.name)
+        return future is not None and not future.done()
 
     def run_once(self):
         """Run a single check of all sites."""
         print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting site check...")
         self.check_all_sites()
-        print("Check complete.\n")
+        print("Check complete.")
+        self.print_stats()
+        print()
 
     def run(self):
         """Run the bot continuously."""
         self.running = True
+        self._stop_event.clear()
 
         # Set up signal handlers for graceful shutdown
         def signal_handler(signum, frame):
             print("\nShutting down gracefully...")
             self.running = False
+            # Wake the main loop immediately; close() drains the workers
+            self._stop_event.set()
 
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
@@ -111,27 +183,70 @@ class SiteMonitorBot:
 
         print("Sites being monitored:")
         for i, site in enumerate(self.config.sites, 1):
-            interval = site.interval or self.config.settings.check_interval
-            print(f"  {i}. {site.name} ({site.url}) - every {interval}s")
+            print(f"  {i}. {site.name} ({site.url}) - every {self._get_interval(site)}s")
         print()
 
-        # Schedule checks for each site
-        for site in self.config.sites:
-            interval = site.interval or self.config.settings.check_interval
-            schedule.every(interval).seconds.do(self.check_site, site)
-
         # Run initial check
+        start = time.monotonic()
         print("Running initial check...")
         self.check_all_sites()
         print("\nMonitoring started. Press Ctrl+C to stop.\n")
 
-        # Main loop
-        while self.running:
-            schedule.run_pending()
-            time.sleep(1)
+        # Min-heap of (next due time, index, site); the index breaks ties
+        # since SiteConfig is not orderable
+        heap = [(start + self._get_interval(site), i, site)
+                for i, site in enumerate(self.config.sites)]
+        heapq.heapify(heap)
 
+        # Main loop: sleep exactly until the next site is due
+        while self.running:
+            if not heap:
+                self._stop_event.wait()
+                continue
+
+            now = time.monotonic()
+            if heap[0][0] > now:
+                self._stop_event.wait(heap[0][0] - now)
+                continue
+
+            # Collect every site that is due, so sites sharing a URL are
+            # fetched together
+            due_entries = []
+            while heap and heap[0][0] <= now:
+                due_entries.append(heapq.heappop(heap))
+
+            due_sites = []
+            for due, i, site in due_entries:
+                # Next run is anchored to the previous due time, so checks don't
+                # drift; if the loop fell behind, missed ticks are skipped
+                # rather than replayed
+                interval = self._get_interval(site)
+                missed = int((now - due) // interval)
+                heapq.heappush(heap, (due + (missed + 1) * interval, i, site))
+
+                if self._is_running(site):
+                    # The previous check overran its interval: skip this tick
+                    # instead of queueing more work behind it
+                    elapsed = now - self._last_start[site.name]
+                    self.monitor.record_stat("slow_iterations")
+                    logger.warning(f"Check of {site.name} still running after {elapsed:.1f}s "
+                                   f"(interval {interval}s), skipping this run")
+                    continue
+                due_sites.append(site)
+
+            for group in self._group_sites(due_sites):
+                self._submit(group)
+
+        self.close()
+        self.print_stats()
         print("Bot stopped.")
 
+    def close(self):
+        """Release worker threads and resources held by the monitor."""
+        self._executor.shutdown(wait=True)
+        self.monitor.close()
+        self.notification_manager.close()
+
     def list_sites(self):
         """List all monitored sites and their status."""
         print("\nMonitored Sites:")
@@ -139,7 +254,7 @@ class SiteMonitorBot:
 
         for i, site in enumerate(self.config.sites, 1):
             status = self.monitor.get_site_status(site.name)
-            interval = site.interval or self.config.settings.check_interval
+            interval = self._get_interval(site)
 
             print(f"\n{i}. {site.name}")
             print(f"   URL: {site.url}")
@@ -152,6 +267,16 @@ class SiteMonitorBot:
 
         print("\n" + "-" * 60)
 
+    def print_stats(self):
+        """Print how checks were settled since the bot started, if any ran."""
+        stats = self.monitor.stats
+        if not stats:
+            return
+        print(f"Checks settled by: 304 Not Modified: {stats['304_hits']}, "
+              f"unchanged hash: {stats['hash_hits']}, changes: {stats['changes']}")
+        if stats['slow_iterations']:
+            print(f"Skipped runs of overrunning checks: {stats['slow_iterations']}")
+
     def show_history(self, site_name: str, limit: int = 20):
         """Show change history for a site."""
         # Find site by name
@@ -165,7 +290,7 @@ class SiteMonitorBot:
             print(f"Site '{site_name}' not found.")
             return
 
-        history = self.monitor.load_history(site.name)
+        history = self.monitor.tail_history(site.name, limit)
 
         print(f"\nChange History for {site.name}:")
         print("-" * 60)
@@ -174,7 +299,7 @@ class SiteMonitorBot:
             print("No history available.")
             return
 
-        for event in history[-limit:]:
+        for event in history:
             timestamp = event.get('timestamp', 'Unknown')
             event_type = event.get('event', 'unknown')
 
@@ -4,8 +4,6 @@ import os
 from dataclasses import dataclass, field
 from typing import Optional
 
-import yaml
-
 from .monitor import SiteConfig
 
 
@@ -18,6 +16,8 @@ class EmailConfig:
     password: str
     from_addr: str
     to_addr: str
+    batch_window: int = 0  # seconds; 0 sends one email per change
+    batch_max: int = 20
 
 
 @dataclass
@@ -26,6 +26,7 @@ class Settings:
     check_interval: int = 60
     data_dir: str = "./data"
     log_level: str = "INFO"
+    fsync: bool = False
     webhook_url: Optional[str] = None
     email: Optional[EmailConfig] = None
 
@@ -39,6 +40,8 @@ class Config:
 
 def load_config(config_path: str = "config.yaml") -> Config:
     """Load configuration from YAML file."""
+    import yaml
+
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
@@ -56,13 +59,16 @@ def load_config(config_path: str = "config.yaml") -> Config:
             username=email_data.get('username', ''),
             password=email_data.get('password', ''),
             from_addr=email_data.get('from_addr', ''),
-            to_addr=email_data.get('to_addr', '')
+            to_addr=email_data.get('to_addr', ''),
+            batch_window=email_data.get('batch_window', 0),
+            batch_max=email_data.get('batch_max', 20)
         )
 
     settings = Settings(
         check_interval=settings_data.get('check_interval', 60),
         data_dir=settings_data.get('data_dir', './data'),
         log_level=settings_data.get('log_level', 'INFO'),
+        fsync=settings_data.get('fsync', False),
         webhook_url=settings_data.get('webhook_url'),
         email=email_config
     )
@@ -77,7 +83,8 @@ def load_config(config_path: str = "config.yaml") -> Config:
             selector=site_data.get('selector'),
             interval=site_data.get('interval'),
             ignore=site_data.get('ignore', []),
-            headers=site_data.get('headers', {})
+            headers=site_data.get('headers', {}),
+            max_bytes=site_data.get('max_bytes', 10_000_000)
         )
         sites.append(site)
 
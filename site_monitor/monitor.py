@@ -2,15 +2,118 @@
 
 import hashlib
 import json
+import logging
 import os
 import re
 import difflib
+import subprocess
+import tempfile
+import threading
+from collections import Counter, OrderedDict, deque
 from datetime import datetime
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 from dataclasses import dataclass, field
 
-import requests
-from bs4 import BeautifulSoup
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# requests and lxml are imported where they are used, so CLI paths that only
+# read local state (--init, --list, --history) don't pay for importing them
+if TYPE_CHECKING:
+    import requests
+    from lxml.cssselect import CSSSelector
+
+logger = logging.getLogger(__name__)
+
+
+_SAFE_NAME_RE = re.compile(r'[^\w\-]')
+
+# A whitespace run containing at least one line break. Collapsing these to "\n"
+# is equivalent to splitting into lines, stripping them and dropping blank ones.
+_WS_RE = re.compile(r'\s*[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]\s*')
+
+# Mode for newly created data files. tempfile creates files as 0600, so
+# atomic writes set this (or the replaced file's mode) explicitly. The umask
+# can only be read by setting it, so this is done once at import.
+_umask = os.umask(0)
+os.umask(_umask)
+_DEFAULT_FILE_MODE = 0o666 & ~_umask
+
+# Content fingerprint algorithm, recorded in snapshot metadata
+HASH_ALGO = "blake2b-128"
+
+
+def _new_hasher():
+    """Create a hasher for content fingerprints (change detection, not security)."""
+    return hashlib.blake2b(digest_size=16)
+
+
+# Elements whose text BeautifulSoup's get_text() never included
+_HIDDEN_TEXT_TAGS = ("script", "style", "template", "rt", "rp")
+
+# Elements stripped in "text" mode
+_NON_CONTENT_TAGS = _HIDDEN_TEXT_TAGS + ("noscript", "iframe")
+
+
+def _drop_elements(elements):
+    """
+    Remove elements from their tree. Each one is swapped for an empty comment
+    carrying its tail, so the surrounding text nodes are not merged together
+    and CSS selectors (which never match comments) are unaffected.
+    """
+    from lxml.etree import Comment
+
+    for element in list(elements):
+        parent = element.getparent()
+        if parent is not None:
+            placeholder = Comment()
+            placeholder.tail = element.tail
+            parent.replace(element, placeholder)
+
+
+def _element_text(element, separator: str) -> str:
+    """Join the stripped text nodes under an element, skipping hidden elements."""
+    if next(element.iterancestors(*_HIDDEN_TEXT_TAGS), None) is not None:
+        return ""
+    _drop_elements(el for el in element.iter(*_HIDDEN_TEXT_TAGS) if el is not element)
+    return separator.join(text for text in (t.strip() for t in element.itertext()) if text)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects lone surrogates, which json escapes
+            pass
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_lines(f, size: int) -> Iterator[bytes]:
+    """Yield lines from a binary file without reading past the first `size` bytes."""
+    while size > 0:
+        line = f.readline(size)
+        if not line:
+            return
+        size -= len(line)
+        yield line
+
+
+@lru_cache(maxsize=256)
+def _safe_filename(name: str) -> str:
+    """Convert site name to safe filename."""
+    return _SAFE_NAME_RE.sub('_', name.lower())
 
 
 @dataclass
@@ -25,6 +128,41 @@ class ChangeRecord:
     old_content: str = ""
     new_content: str = ""
 
+    @cached_property
+    def diff_changes(self) -> list[str]:
+        """Diff lines starting with '+' or '-', computed once for all notifiers."""
+        if not self.diff:
+            return []
+        return [line for line in self.diff if line.startswith(('+', '-'))]
+
+
+@dataclass
+class RawPage:
+    """Raw response body for a URL, shared by every site watching that URL."""
+    url: str
+    body: bytes = b""
+    encoding: str = "utf-8"
+    validators: Optional[dict] = None  # ETag/Last-Modified of the response
+    body_hash: Optional[str] = None  # Set when hashed while streaming
+    not_modified: bool = False  # Server replied 304
+
+    @cached_property
+    def text(self) -> str:
+        """Body decoded once with the declared charset, or UTF-8 if Python doesn't know it."""
+        try:
+            return self.body.decode(self.encoding, errors='replace')
+        except (LookupError, TypeError):
+            return self.body.decode('utf-8', errors='replace')
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching a site."""
+    content: Optional[str]
+    validators: Optional[dict] = None  # ETag/Last-Modified of the response
+    content_hash: Optional[str] = None  # Set when hashed while streaming
+    not_modified: bool = False  # Server replied 304
+
 
 @dataclass
 class SiteConfig:
@@ -36,6 +174,32 @@ class SiteConfig:
     interval: Optional[int] = None
     ignore: list[str] = field(default_factory=list)
     headers: dict = field(default_factory=dict)
+    max_bytes: int = 10_000_000  # Largest response body accepted
+
+    @cached_property
+    def _extract_fingerprint(self) -> str:
+        """Digest of the settings that decide what is extracted from a page."""
+        h = _new_hasher()
+        h.update(_json_dumps([self.mode, self.selector, list(self.ignore)]))
+        return h.hexdigest()
+
+    @cached_property
+    def _compiled_selector(self) -> Optional["CSSSelector"]:
+        """CSS selector compiled once per site."""
+        from lxml.cssselect import CSSSelector
+        return CSSSelector(self.selector, translator='html') if self.selector else None
+
+    @cached_property
+    def _compiled_ignore(self) -> Optional["CSSSelector"]:
+        """Union of the ignore selectors, compiled once and matched in one pass."""
+        from lxml.cssselect import CSSSelector
+        return CSSSelector(", ".join(self.ignore), translator='html') if self.ignore else None
+
+    @cached_property
+    def _compiled_text_removals(self) -> "CSSSelector":
+        """Ignore selectors plus non-content tags, removed in one pass in "text" mode."""
+        from lxml.cssselect import CSSSelector
+        return CSSSelector(", ".join([*self.ignore, *_NON_CONTENT_TAGS]), translator='html')
 
 
 class SiteMonitor:
@@ -48,11 +212,63 @@ class SiteMonitor:
         "Accept-Language": "en-US,en;q=0.5",
     }
 
-    def __init__(self, data_dir: str = "./data"):
+    # Number of raw pages whose extracted content is kept in memory
+    EXTRACT_CACHE_SIZE = 128
+
+    # Bytes read from the end of a history file to find the latest events
+    HISTORY_TAIL_BYTES = 65536
+
+    # Documents with at least this many lines are diffed with GNU diff, which
+    # stays fast where difflib's matcher goes quadratic
+    EXTERNAL_DIFF_MIN_LINES = 20000
+
+    def __init__(self, data_dir: str = "./data", fsync: bool = False):
         self.data_dir = data_dir
+        self.fsync = fsync
         self.snapshots_dir = os.path.join(data_dir, "snapshots")
         self.history_dir = os.path.join(data_dir, "history")
         self._ensure_dirs()
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+        self._extract_cache: OrderedDict = OrderedDict()
+        self._extract_lock = threading.Lock()
+        self._migrated_history: set[str] = set()
+        self._write_locks: dict[str, threading.Lock] = {}
+        # How often each step of check_site settled the check
+        self.stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        """Pooled HTTP session reused across checks, created on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> "requests.Session":
+        """Create a pooled HTTP session reused across checks."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(self.DEFAULT_HEADERS)
+        return session
+
+    def close(self):
+        """Close the HTTP session and release pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def _ensure_dirs(self):
         """Create necessary directories."""
@@ -61,7 +277,7 @@ class SiteMonitor:
 
     def _get_safe_filename(self, name: str) -> str:
         """Convert site name to safe filename."""
-        return re.sub(r'[^\w\-]', '_', name.lower())
+        return _safe_filename(name)
 
     def _get_snapshot_path(self, site_name: str) -> str:
         """Get path to snapshot file for a site."""
@@ -71,54 +287,224 @@ class SiteMonitor:
     def _get_history_path(self, site_name: str) -> str:
         """Get path to history file for a site."""
         filename = self._get_safe_filename(site_name)
-        return os.path.join(self.history_dir, f"{filename}.json")
+        path = os.path.join(self.history_dir, f"{filename}.jsonl")
+        if site_name not in self._migrated_history:
+            legacy_path = os.path.join(self.history_dir, f"{filename}.json")
+            self._migrate_history(legacy_path, path)
+            self._migrated_history.add(site_name)
+        return path
+
+    def _migrate_history(self, legacy_path: str, path: str):
+        """Convert a legacy JSON-list history file to JSON Lines."""
+        if not os.path.exists(legacy_path) or os.path.exists(path):
+            return
+        with open(legacy_path, 'rb') as f:
+            history = _json_loads(f.read())
+        self._write_history_lines(path, history)
+        os.remove(legacy_path)
+
+    def _atomic_write(self, path: str, data: bytes):
+        """
+        Write a file atomically: write a temp file in the same directory, then
+        os.replace() it over the target, so readers never see a partial file.
+        """
+        lock = self._write_locks.setdefault(path, threading.Lock())
+        with lock:
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as f:
+                try:
+                    f.write(data)
+                    f.flush()
+                    try:
+                        mode = os.stat(path).st_mode & 0o7777
+                    except FileNotFoundError:
+                        mode = _DEFAULT_FILE_MODE
+                    os.chmod(f.name, mode)
+                    if self.fsync:
+                        os.fsync(f.fileno())
+                except BaseException:
+                    f.close()
+                    os.remove(f.name)
+                    raise
+            os.replace(f.name, path)
+
+    def _get_counters_path(self, site_name: str) -> str:
+        """Get path to the history counters file for a site."""
+        filename = self._get_safe_filename(site_name)
+        return os.path.join(self.history_dir, f"{filename}.counters.json")
+
+    def _get_meta_path(self, site_name: str) -> str:
+        """Get path to the snapshot metadata file for a site."""
+        filename = self._get_safe_filename(site_name)
+        return os.path.join(self.snapshots_dir, f"{filename}.meta.json")
 
     def fetch_content(self, site: SiteConfig) -> Optional[str]:
         """Fetch and process content from a URL."""
+        result = self._fetch(site, self._load_site_meta(site))
+        if result.not_modified:
+            return self.load_snapshot(site.name)
+        return result.content
+
+    def _fetch(self, site: SiteConfig, meta: dict,
+               previous_hash: Optional[str] = None) -> FetchResult:
+        """Fetch a site, revalidating against its stored ETag/Last-Modified, and process it."""
+        page = self._fetch_raw(site.url, site.headers, site.max_bytes,
+                               meta, hash_body=site.mode == "full")
+        return self._process(site, page, previous_hash)
+
+    def fetch_page(self, sites: list[SiteConfig]) -> RawPage:
+        """
+        Fetch a URL once on behalf of several sites that share the same URL and
+        headers. Validators are only sent when every site has stored the same ones,
+        so a 304 reply holds for all of them.
+        """
+        site = sites[0]
+        metas = [self._load_site_meta(s) for s in sites]
+        validators = {(meta.get("etag"), meta.get("last_modified")) for meta in metas}
+        meta = metas[0] if len(validators) == 1 else {}
+        return self._fetch_raw(site.url, site.headers, max(s.max_bytes for s in sites),
+                               meta, hash_body=any(s.mode == "full" for s in sites))
+
+    def _fetch_raw(self, url: str, site_headers: dict, max_bytes: int,
+                   meta: dict, hash_body: bool = False) -> RawPage:
+        """
+        Download a URL, sending If-None-Match/If-Modified-Since from meta.
+        The body is streamed and capped at max_bytes; with hash_body it is also
+        hashed while streaming.
+        """
+        import requests
+
+        # Per-site headers are merged over the session defaults
+        headers = dict(site_headers)
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        h = _new_hasher() if hash_body else None
         try:
-            headers = {**self.DEFAULT_HEADERS, **site.headers}
-            response = requests.get(
-                site.url,
+            response = self.session.get(
+                url,
                 headers=headers,
-                timeout=30,
-                allow_redirects=True
+                timeout=(5, 30),
+                allow_redirects=True,
+                stream=True
             )
-            response.raise_for_status()
+            with response:
+                if response.status_code == 304:
+                    return RawPage(url, not_modified=True)
+                response.raise_for_status()
+
+                validators = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+
+                declared = response.headers.get("Content-Length", "")
+                if declared.isdigit() and int(declared) > max_bytes:
+                    raise RuntimeError(f"Response from {url} is too large "
+                                       f"({declared} bytes, limit {max_bytes})")
+
+                buf = bytearray()
+                for chunk in response.iter_content(65536):
+                    buf.extend(chunk)
+                    if len(buf) > max_bytes:
+                        raise RuntimeError(f"Response from {url} is too large "
+                                           f"(limit {max_bytes} bytes)")
+                    if h is not None:
+                        h.update(chunk)
+                # Use the declared charset; skip the costly detection fallback
+                encoding = response.encoding or 'utf-8'
+        except requests.RequestException as e:
+            raise RuntimeError(f"Failed to fetch {url}: {e}")
+
+        return RawPage(url, bytes(buf), encoding, validators,
+                       body_hash=h.hexdigest() if h is not None else None)
 
-            content = response.text
+    def _process(self, site: SiteConfig, page: RawPage,
+                 previous_hash: Optional[str] = None) -> FetchResult:
+        """
+        Turn a raw page into the content monitored for a site. In "full" mode the
+        body hash is compared first; if it matches previous_hash the body is never
+        decoded and the result carries no content.
+        """
+        if page.not_modified:
+            return FetchResult(None, not_modified=True)
+        if len(page.body) > site.max_bytes:
+            raise RuntimeError(f"Response from {site.url} is too large "
+                               f"(limit {site.max_bytes} bytes)")
+
+        if site.mode != "full":
+            return FetchResult(self._extract(page.text, site), page.validators)
+
+        content_hash = page.body_hash
+        if content_hash is None:
+            h = _new_hasher()
+            h.update(page.body)
+            content_hash = h.hexdigest()
+        if content_hash == previous_hash:
+            return FetchResult(None, page.validators, content_hash)
+        return FetchResult(page.text, page.validators, content_hash)
+
+    def _extract(self, content: str, site: SiteConfig) -> Optional[str]:
+        """
+        Extract the monitored content from raw HTML according to the site mode.
+        Results are memoized by a digest of the raw HTML, so a page that repeats
+        byte-for-byte is not parsed again.
+        """
+        if site.mode == "full":
+            return content
 
-            if site.mode == "full":
-                return content
+        raw_hash = hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+        key = (raw_hash, site.mode, site.selector, tuple(site.ignore))
+        with self._extract_lock:
+            if key in self._extract_cache:
+                self._extract_cache.move_to_end(key)
+                return self._extract_cache[key]
 
-            soup = BeautifulSoup(content, 'lxml')
+        extracted = self._parse(content, site)
 
-            # Remove ignored elements
-            for selector in site.ignore:
-                for element in soup.select(selector):
-                    element.decompose()
-
-            if site.mode == "selector" and site.selector:
-                elements = soup.select(site.selector)
-                if elements:
-                    return "\n".join(el.get_text(strip=True, separator=" ") for el in elements)
-                return None
+        with self._extract_lock:
+            self._extract_cache[key] = extracted
+            if len(self._extract_cache) > self.EXTRACT_CACHE_SIZE:
+                self._extract_cache.popitem(last=False)
+        return extracted
 
-            # mode == "text"
-            # Remove script and style elements
-            for tag in soup(['script', 'style', 'noscript', 'iframe']):
-                tag.decompose()
+    def _parse(self, content: str, site: SiteConfig) -> Optional[str]:
+        """Parse raw HTML and extract text for "text" and "selector" modes."""
+        import lxml.html
+        from lxml.etree import ParserError
 
-            text = soup.get_text(separator='\n', strip=True)
-            # Normalize whitespace
-            lines = [line.strip() for line in text.splitlines() if line.strip()]
-            return '\n'.join(lines)
+        try:
+            tree = lxml.html.document_fromstring(
+                content.encode('utf-8', 'surrogatepass'),
+                parser=lxml.html.HTMLParser(encoding='utf-8')
+            )
+        except ParserError:
+            # Empty document
+            return None if site.mode == "selector" and site.selector else ""
 
-        except requests.RequestException as e:
-            raise RuntimeError(f"Failed to fetch {site.url}: {e}")
+        if site.mode == "selector" and site.selector:
+            # Remove ignored elements
+            if site._compiled_ignore is not None:
+                _drop_elements(site._compiled_ignore(tree))
+            elements = site._compiled_selector(tree)
+            if elements:
+                return "\n".join(_element_text(el, " ") for el in elements)
+            return None
+
+        # mode == "text"
+        # Remove ignored elements and script/style elements in a single pass
+        _drop_elements(site._compiled_text_removals(tree))
+
+        text = _element_text(tree, "\n")
+        # Normalize whitespace
+        return _WS_RE.sub('\n', text).strip()
 
     def get_content_hash(self, content: str) -> str:
         """Generate hash of content."""
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        h = _new_hasher()
+        h.update(content.encode('utf-8', 'surrogatepass'))
+        return h.hexdigest()
 
     def load_snapshot(self, site_name: str) -> Optional[str]:
         """Load previous snapshot for a site."""
@@ -128,105 +514,365 @@ class SiteMonitor:
                 return f.read()
         return None
 
+    def _snapshot_hash(self, site_name: str) -> Optional[str]:
+        """Hash the stored snapshot file, matching get_content_hash() of its text."""
+        path = self._get_snapshot_path(site_name)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, _new_hasher).hexdigest()
+            # Python < 3.11
+            h = _new_hasher()
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                h.update(chunk)
+            return h.hexdigest()
+
     def save_snapshot(self, site_name: str, content: str):
         """Save current content as snapshot."""
         path = self._get_snapshot_path(site_name)
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._atomic_write(path, content.encode('utf-8', 'surrogatepass'))
+
+    def load_meta(self, site_name: str) -> dict:
+        """
+        Load snapshot metadata (HTTP validators and content hash) for a site.
+        Metadata is ignored when the snapshot it describes is missing.
+        """
+        path = self._get_meta_path(site_name)
+        if os.path.exists(path) and os.path.exists(self._get_snapshot_path(site_name)):
+            with open(path, 'rb') as f:
+                return _json_loads(f.read())
+        return {}
+
+    def _load_site_meta(self, site: SiteConfig) -> dict:
+        """
+        Load snapshot metadata for a site, ignoring it if the snapshot was taken
+        with different extraction settings (mode, selector or ignore list): a 304
+        would otherwise keep serving the old extraction.
+        """
+        meta = self.load_meta(site.name)
+        if meta.get("extract") != site._extract_fingerprint:
+            return {}
+        return meta
+
+    def save_meta(self, site_name: str, meta: dict):
+        """Save snapshot metadata for a site."""
+        path = self._get_meta_path(site_name)
+        self._atomic_write(path, _json_dumps(meta))
+
+    def iter_history(self, site_name: str) -> Iterator[dict]:
+        """Iterate over the change history for a site, oldest first."""
+        path = self._get_history_path(site_name)
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as f:
+            yield from self._decode_history_lines(site_name, f)
 
     def load_history(self, site_name: str) -> list[dict]:
         """Load change history for a site."""
+        return list(self.iter_history(site_name))
+
+    def tail_history(self, site_name: str, limit: int) -> list[dict]:
+        """Load the last `limit` history events without reading the whole file."""
         path = self._get_history_path(site_name)
+        if not os.path.exists(path) or limit <= 0:
+            return []
+
+        with open(path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            offset = max(0, size - self.HISTORY_TAIL_BYTES)
+            f.seek(offset)
+            lines = f.read().splitlines()
+        if offset:
+            # The first line is most likely cut in half
+            lines = lines[1:]
+        lines = [line for line in lines if line.strip()]
+
+        events = list(self._decode_history_lines(site_name, lines))
+        if offset and len(events) < limit:
+            # Events are too large to fit in the tail window
+            return list(deque(self.iter_history(site_name), maxlen=limit))
+        return events[-limit:]
+
+    def _decode_history_lines(self, site_name: str, lines: Iterable[bytes]) -> Iterator[dict]:
+        """
+        Decode JSON Lines history events, skipping lines that can't be parsed,
+        such as a last line cut short by a crash during an append.
+        """
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield _json_loads(line)
+            except ValueError:
+                logger.warning(f"Skipping unreadable history line for {site_name}")
+
+    def _repair_history_tail(self, path: str):
+        """Cut off a partially written last line so the next append starts cleanly."""
+        if not os.path.exists(path):
+            return
+        with open(path, 'r+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            if not size:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            offset = max(0, size - self.HISTORY_TAIL_BYTES)
+            f.seek(offset)
+            end = f.read().rfind(b"\n")
+            if end < 0 and offset:
+                f.seek(0)
+                end = f.read().rfind(b"\n")
+                offset = 0
+            f.truncate(offset + end + 1)
+
+    def load_counters(self, site_name: str) -> dict:
+        """
+        Load history counters (total_changes, last_timestamp, last_event) for a site.
+        Counters record the history file size they were computed at, and are
+        rebuilt from the history if missing or out of date.
+        """
+        history_path = self._get_history_path(site_name)
+        size = os.path.getsize(history_path) if os.path.exists(history_path) else 0
+        path = self._get_counters_path(site_name)
         if os.path.exists(path):
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
+            with open(path, 'rb') as f:
+                counters = _json_loads(f.read())
+            if counters.get("history_size") == size:
+                return counters
+        return self._rebuild_counters(site_name)
+
+    def _rebuild_counters(self, site_name: str) -> dict:
+        """Recompute history counters with a full scan of the history."""
+        counters = {"total_changes": 0, "last_timestamp": None, "last_event": None,
+                    "history_size": 0}
+        history_path = self._get_history_path(site_name)
+        if os.path.exists(history_path):
+            with open(history_path, 'rb') as f:
+                # Only count what was there when the scan started, so an event
+                # appended meanwhile is picked up by the next size check
+                size = os.fstat(f.fileno()).st_size
+                for event in self._decode_history_lines(site_name, _read_lines(f, size)):
+                    self._count_event(counters, event)
+            counters["history_size"] = size
+        self._save_counters(site_name, counters)
+        return counters
+
+    def _count_event(self, counters: dict, event: dict):
+        """Fold one history event into the counters."""
+        if event.get("event") == "change_detected":
+            counters["total_changes"] += 1
+        counters["last_timestamp"] = event.get("timestamp")
+        counters["last_event"] = event.get("event")
+
+    def _save_counters(self, site_name: str, counters: dict):
+        """Save history counters for a site."""
+        path = self._get_counters_path(site_name)
+        self._atomic_write(path, _json_dumps(counters))
+
+    def save_history_event(self, site_name: str, event: dict):
+        """Append a single event to the change history for a site and update its counters."""
+        path = self._get_history_path(site_name)
+        self._repair_history_tail(path)
+        counters = self.load_counters(site_name)
+        with open(path, 'ab') as f:
+            f.write(_json_dumps(event) + b"\n")
+            counters["history_size"] = f.tell()
+        self._count_event(counters, event)
+        self._save_counters(site_name, counters)
 
     def save_history(self, site_name: str, history: list[dict]):
-        """Save change history for a site."""
-        path = self._get_history_path(site_name)
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(history, f, indent=2)
+        """Save (overwrite) the change history for a site."""
+        self._write_history_lines(self._get_history_path(site_name), history)
+
+    def _write_history_lines(self, path: str, history: list[dict]):
+        """Atomically write a list of events to a JSON Lines file."""
+        self._atomic_write(path, b"".join(_json_dumps(event) + b"\n" for event in history))
 
     def get_diff(self, old_content: str, new_content: str) -> list[str]:
         """Generate unified diff between old and new content."""
+        return self._diff(old_content, new_content)[0]
+
+    def _diff(self, old_content: str, new_content: str) -> tuple[list[str], int]:
+        """
+        Generate unified diff between old and new content.
+        Returns (diff, diff_lines) where diff_lines counts lines starting with + or -.
+        """
         old_lines = old_content.splitlines(keepends=True)
         new_lines = new_content.splitlines(keepends=True)
 
-        diff = list(difflib.unified_diff(
-            old_lines, new_lines,
-            fromfile='previous',
-            tofile='current',
-            lineterm=''
-        ))
+        diff = None
+        if max(len(old_lines), len(new_lines)) >= self.EXTERNAL_DIFF_MIN_LINES:
+            diff = self._diff_external(old_content, new_content)
+        if diff is None:
+            diff = list(difflib.unified_diff(
+                old_lines, new_lines,
+                fromfile='previous',
+                tofile='current',
+                lineterm=''
+            ))
+        return diff, len([l for l in diff if l.startswith('+') or l.startswith('-')])
+
+    def _diff_external(self, old_content: str, new_content: str) -> Optional[list[str]]:
+        """
+        Unified diff from GNU diff, in the same shape difflib produces.
+        Returns None if diff is not installed or fails.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name, content in (("previous", old_content), ("current", new_content)):
+                path = os.path.join(tmp, name)
+                with open(path, 'w', encoding='utf-8', newline='') as f:
+                    f.write(content)
+                paths.append(path)
+            try:
+                result = subprocess.run(
+                    ['diff', '-u', '-a', '--label', 'previous', '--label', 'current', *paths],
+                    capture_output=True,
+                )
+            except OSError as e:
+                logger.debug(f"External diff unavailable, using difflib: {e}")
+                return None
+        # 0 means identical, 1 means the files differ, anything else is trouble
+        if result.returncode not in (0, 1):
+            logger.warning(f"External diff failed, using difflib: {result.stderr.decode(errors='replace').strip()}")
+            return None
+        diff = []
+        # Split on newlines only; diff treats \r and form feeds as line content
+        for line in result.stdout.decode('utf-8', errors='replace').split('\n')[:-1]:
+            if line.startswith('\\'):
+                # "\ No newline at end of file" applies to the line above
+                diff[-1] = diff[-1][:-1]
+            elif len(diff) < 2 or line.startswith('@@'):
+                # Header and hunk lines carry no terminator, as with lineterm=''
+                diff.append(line)
+            else:
+                diff.append(line + '\n')
         return diff
 
-    def check_site(self, site: SiteConfig) -> Optional[ChangeRecord]:
+    def check_site(self, site: SiteConfig,
+                   page: Optional[RawPage] = None) -> Optional[ChangeRecord]:
         """
         Check a site for changes.
         Returns ChangeRecord if changes detected, None otherwise.
+        A page already fetched with fetch_page() can be passed to share one
+        download between sites watching the same URL.
+
+        Work is ordered from cheapest to most expensive, returning as soon as a
+        step shows the content is unchanged:
+          1. conditional GET answered 304 Not Modified
+          2. content hash equals the hash stored in the snapshot metadata
+          3. load the snapshot, diff, and record the change
         """
-        current_content = self.fetch_content(site)
-        if current_content is None:
+        meta = self._load_site_meta(site)
+        # Hashes from another algorithm (sha256 before metadata recorded
+        # hash_algo) are recomputed once from the snapshot below
+        previous_hash = meta.get("hash") if meta.get("hash_algo") == HASH_ALGO else None
+
+        # 1. Conditional GET
+        if page is None:
+            result = self._fetch(site, meta, previous_hash=previous_hash)
+        else:
+            result = self._process(site, page, previous_hash=previous_hash)
+        if result.not_modified:
+            self.record_stat("304_hits")
+            return None
+        if result.content is None and result.content_hash is None:
+            # Nothing to compare (selector matched no elements)
+            return None
+
+        # 2. Hash comparison
+        current_content = result.content
+        current_hash = result.content_hash or self.get_content_hash(current_content)
+        # Validators are only persisted once the matching snapshot is on disk
+        new_meta = {**result.validators, "hash": current_hash, "hash_algo": HASH_ALGO,
+                    "extract": site._extract_fingerprint}
+
+        if current_hash == previous_hash:
+            # Neither the snapshot nor the history needs to be read
+            self.record_stat("hash_hits")
+            if new_meta != meta:
+                self.save_meta(site.name, new_meta)
             return None
 
-        current_hash = self.get_content_hash(current_content)
+        # 3. Slow path: compare against the snapshot
+        if previous_hash is None:
+            # No usable metadata: hash the snapshot file as stored, which
+            # settles "unchanged" without reading and decoding it
+            previous_hash = self._snapshot_hash(site.name)
+            if previous_hash is not None:
+                text_hash = (current_hash if result.content_hash is None
+                             else self.get_content_hash(current_content))
+                if previous_hash == text_hash:
+                    self.record_stat("hash_hits")
+                    self.save_meta(site.name, new_meta)
+                    return None
+
         previous_content = self.load_snapshot(site.name)
 
         if previous_content is None:
             # First time checking this site
             self.save_snapshot(site.name, current_content)
-            history = self.load_history(site.name)
-            history.append({
+            self.save_meta(site.name, new_meta)
+            self.save_history_event(site.name, {
                 "timestamp": datetime.now().isoformat(),
                 "event": "initial_snapshot",
                 "hash": current_hash
             })
-            self.save_history(site.name, history)
             return None
 
-        previous_hash = self.get_content_hash(previous_content)
-
-        if current_hash != previous_hash:
-            # Change detected!
-            diff = self.get_diff(previous_content, current_content)
-            timestamp = datetime.now().isoformat()
-
-            # Save new snapshot
-            self.save_snapshot(site.name, current_content)
-
-            # Update history
-            history = self.load_history(site.name)
-            history.append({
-                "timestamp": timestamp,
-                "event": "change_detected",
-                "old_hash": previous_hash,
-                "new_hash": current_hash,
-                "diff_lines": len([l for l in diff if l.startswith('+') or l.startswith('-')])
-            })
-            self.save_history(site.name, history)
-
-            return ChangeRecord(
-                site_name=site.name,
-                url=site.url,
-                timestamp=timestamp,
-                old_hash=previous_hash,
-                new_hash=current_hash,
-                diff=diff,
-                old_content=previous_content,
-                new_content=current_content
-            )
+        if previous_content == current_content:
+            # Hashes can differ for identical content when the metadata predates
+            # the snapshot or was computed over raw bytes ("full" mode)
+            self.record_stat("hash_hits")
+            self.save_meta(site.name, new_meta)
+            return None
 
-        return None
+        # Change detected!
+        self.record_stat("changes")
+        previous_hash = previous_hash or self.get_content_hash(previous_content)
+        diff, diff_lines = self._diff(previous_content, current_content)
+        timestamp = datetime.now().isoformat()
+
+        # Update history first: if it fails, the snapshot is left alone and the
+        # change is detected (and notified) again on the next check
+        self.save_history_event(site.name, {
+            "timestamp": timestamp,
+            "event": "change_detected",
+            "old_hash": previous_hash,
+            "new_hash": current_hash,
+            "diff_lines": diff_lines
+        })
+
+        # Save new snapshot, then its metadata
+        self.save_snapshot(site.name, current_content)
+        self.save_meta(site.name, new_meta)
+
+        return ChangeRecord(
+            site_name=site.name,
+            url=site.url,
+            timestamp=timestamp,
+            old_hash=previous_hash,
+            new_hash=current_hash,
+            diff=diff,
+            old_content=previous_content,
+            new_content=current_content
+        )
+
+    def record_stat(self, key: str):
+        """Increment a check statistic."""
+        with self._stats_lock:
+            self.stats[key] += 1
 
     def get_site_status(self, site_name: str) -> dict:
         """Get current monitoring status for a site."""
         snapshot_path = self._get_snapshot_path(site_name)
-        history = self.load_history(site_name)
+        counters = self.load_counters(site_name)
 
         return {
             "has_snapshot": os.path.exists(snapshot_path),
-            "total_changes": len([h for h in history if h.get("event") == "change_detected"]),
-            "last_check": history[-1]["timestamp"] if history else None,
-            "history": history[-10:]  # Last 10 events
+            "total_changes": counters["total_changes"],
+            "last_check": counters["last_timestamp"],
+            "history": self.tail_history(site_name, 10)  # Last 10 events
         }
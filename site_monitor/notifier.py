@@ -1,33 +1,134 @@
 """Notification system for site monitor."""
 
-import json
+import concurrent.futures
 import logging
+import random
 import smtplib
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from typing import Optional
-
-import requests
-
-from .monitor import ChangeRecord
+from collections import deque
+from email import policy
+from email.message import EmailMessage
+from email.utils import parsedate_to_datetime
+from string import Template
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
+
+from .monitor import ChangeRecord, _json_dumps
 from .config import EmailConfig
 
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
+# Per-request timeout used when no deadline is given, in seconds
+DEFAULT_TIMEOUT = 10
+# Upper bound for establishing a connection, in seconds
+CONNECT_TIMEOUT = 3.05
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a notification's time budget ran out before it could be sent."""
+
+
+def _remaining(deadline: Optional[float]) -> float:
+    """Seconds left until a time.monotonic() deadline, or the default timeout."""
+    if deadline is None:
+        return DEFAULT_TIMEOUT
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded("notification deadline exceeded")
+    return remaining
+
+# Email bodies; per-change sections are repeated once per change in a batch
+_EMAIL_TEXT = Template("""
+$heading
+$sections""")
+
+_EMAIL_TEXT_SECTION = Template("""
+Site: $site_name
+URL: $url
+Time: $timestamp
+
+Old Hash: $old_hash
+New Hash: $new_hash
+
+Diff:
+$diff
+""")
+
+_EMAIL_HTML = Template("""
+<html>
+<body>
+<h2 style="color: #FF6B6B;">$heading</h2>
+$sections<p><small>Sent by Site Monitor Bot</small></p>
+</body>
+</html>
+""")
+
+_EMAIL_HTML_SECTION = Template("""<table>
+<tr><td><strong>Site:</strong></td><td>$site_name</td></tr>
+<tr><td><strong>URL:</strong></td><td><a href="$url">$url</a></td></tr>
+<tr><td><strong>Time:</strong></td><td>$timestamp</td></tr>
+</table>
+<h3>Changes:</h3>
+<pre style="background: #f4f4f4; padding: 10px; font-family: monospace;">
+$diff
+</pre>
+""")
+
+# Opening tag for added/removed diff lines in HTML emails, keyed by first character
+_DIFF_LINE_SPANS = {
+    '+': '<span style="color: green;">',
+    '-': '<span style="color: red;">',
+}
+
+
+def _diff_line_html(line: str) -> str:
+    """Colorize one unified diff line for HTML; file headers are left plain."""
+    span = _DIFF_LINE_SPANS.get(line[:1])
+    if span is None or line.startswith(('+++', '---')):
+        return line
+    return f'{span}{line}</span>'
+
 
 class Notifier(ABC):
     """Base class for notifiers."""
 
     @abstractmethod
-    def notify(self, change: ChangeRecord) -> bool:
-        """Send notification about a change. Returns True if successful."""
+    def notify(self, change: ChangeRecord, deadline: Optional[float] = None) -> bool:
+        """
+        Send notification about a change. Returns True if successful.
+        deadline is a time.monotonic() value by which sending must be finished.
+        """
+        pass
+
+    def should_notify(self, change: ChangeRecord) -> bool:
+        """Whether this notifier wants to hear about a change. Defaults to every change."""
+        return True
+
+    @property
+    def backend_key(self) -> Optional[tuple[str, str]]:
+        """(type, host) of the remote backend, used to bound concurrent calls."""
+        return None
+
+    def close(self):
+        """Release any resources held by the notifier."""
         pass
 
 
 class ConsoleNotifier(Notifier):
     """Outputs change notifications to console."""
 
+    _BAR = "=" * 60
+    _TITLE = "CHANGE DETECTED!"
+    # Serializes output across instances and threads: when stdout is not a
+    # terminal, colorama's wrapper splits each write at every color code
+    _write_lock = threading.Lock()
+
     def __init__(self, show_diff: bool = True, colorize: bool = True):
         self.show_diff = show_diff
         self.colorize = colorize
@@ -36,49 +137,130 @@ class ConsoleNotifier(Notifier):
             init()
             self.Fore = Fore
             self.Style = Style
+            # Color for added/removed diff lines, keyed by first character
+            self._diff_colors = {'+': Fore.GREEN, '-': Fore.RED}
+            self._bar_color = f"{Fore.YELLOW}{self._BAR}{Style.RESET_ALL}"
+            self._title_color = f"{Fore.RED}{self._TITLE}{Style.RESET_ALL}"
         except ImportError:
             self.colorize = False
 
-    def notify(self, change: ChangeRecord) -> bool:
+    def notify(self, change: ChangeRecord, deadline: Optional[float] = None) -> bool:
         """Print change notification to console."""
+        # Output is collected and written at once under _write_lock, so
+        # notifications for sites checked in parallel don't interleave
         if self.colorize:
-            print(f"\n{self.Fore.YELLOW}{'='*60}{self.Style.RESET_ALL}")
-            print(f"{self.Fore.RED}CHANGE DETECTED!{self.Style.RESET_ALL}")
-            print(f"{self.Fore.CYAN}Site:{self.Style.RESET_ALL} {change.site_name}")
-            print(f"{self.Fore.CYAN}URL:{self.Style.RESET_ALL} {change.url}")
-            print(f"{self.Fore.CYAN}Time:{self.Style.RESET_ALL} {change.timestamp}")
-            print(f"{self.Fore.YELLOW}{'='*60}{self.Style.RESET_ALL}")
+            cyan, reset = self.Fore.CYAN, self.Style.RESET_ALL
+            parts = [
+                f"\n{self._bar_color}",
+                self._title_color,
+                f"{cyan}Site:{reset} {change.site_name}",
+                f"{cyan}URL:{reset} {change.url}",
+                f"{cyan}Time:{reset} {change.timestamp}",
+                self._bar_color,
+            ]
         else:
-            print(f"\n{'='*60}")
-            print("CHANGE DETECTED!")
-            print(f"Site: {change.site_name}")
-            print(f"URL: {change.url}")
-            print(f"Time: {change.timestamp}")
-            print(f"{'='*60}")
+            parts = [
+                f"\n{self._BAR}",
+                self._TITLE,
+                f"Site: {change.site_name}",
+                f"URL: {change.url}",
+                f"Time: {change.timestamp}",
+                self._BAR,
+            ]
 
         if self.show_diff and change.diff:
-            print("\nDiff:")
-            for line in change.diff[:50]:  # Limit diff output
-                if self.colorize:
-                    if line.startswith('+') and not line.startswith('+++'):
-                        print(f"{self.Fore.GREEN}{line.rstrip()}{self.Style.RESET_ALL}")
-                    elif line.startswith('-') and not line.startswith('---'):
-                        print(f"{self.Fore.RED}{line.rstrip()}{self.Style.RESET_ALL}")
-                    else:
-                        print(line.rstrip())
-                else:
-                    print(line.rstrip())
+            parts.append("\nDiff:")
+            lines = [line.rstrip() for line in change.diff[:50]]  # Limit diff output
+            if self.colorize:
+                colors = self._diff_colors
+                lines = [f"{colors[line[0]]}{line}{reset}"
+                         if line[:1] in colors and not line.startswith(('+++', '---'))
+                         else line
+                         for line in lines]
+            parts.extend(lines)
 
             if len(change.diff) > 50:
-                print(f"\n... and {len(change.diff) - 50} more lines")
+                parts.append(f"\n... and {len(change.diff) - 50} more lines")
 
-        print()
+        parts.append("")
+        output = '\n'.join(parts) + '\n'
+        with self._write_lock:
+            sys.stdout.write(output)
         return True
 
 
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected by an open circuit breaker."""
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing backend for a while.
+
+    Closed: calls go through; failure_threshold consecutive failures open it.
+    Open: calls are rejected with CircuitOpenError until recovery_timeout passes.
+    Half-open: up to half_open_max_calls probes go through; a success closes the
+    breaker again and a failure reopens it.
+
+    Exceptions listed in `ignore` count as neither success nor failure.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1, ignore: tuple[type[BaseException], ...] = ()):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.ignore = ignore
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    raise CircuitOpenError("circuit open")
+                self.state = self.HALF_OPEN
+                self._half_open_calls = 0
+            if self.state == self.HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    raise CircuitOpenError("circuit half-open, probe in progress")
+                self._half_open_calls += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with self._lock:
+            if exc_type is None:
+                self.state = self.CLOSED
+                self._failures = 0
+            elif issubclass(exc_type, self.ignore):
+                # Free the probe slot without judging the backend
+                if self.state == self.HALF_OPEN:
+                    self._half_open_calls -= 1
+            else:
+                self._failures += 1
+                if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                    self.state = self.OPEN
+                    self._opened_at = time.monotonic()
+        return False
+
+
 class WebhookNotifier(Notifier):
     """Sends notifications via webhook (Discord, Slack, etc.)."""
 
+    # Transient failures (rate limits, 5xx, failed connections) are retried with
+    # jittered exponential backoff; other 4xx responses fail at once
+    MAX_RETRIES = 5
+    BACKOFF_FACTOR = 0.5
+    BACKOFF_MAX = 30.0
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
     def __init__(self, webhook_url: str, webhook_type: str = "auto"):
         self.webhook_url = webhook_url
         self.webhook_type = webhook_type
@@ -92,24 +274,135 @@ class WebhookNotifier(Notifier):
             else:
                 self.webhook_type = "generic"
 
-    def notify(self, change: ChangeRecord) -> bool:
+        # Resolve the payload format once instead of on every notification
+        self._send = {
+            "discord": self._send_discord,
+            "slack": self._send_slack,
+        }.get(self.webhook_type, self._send_generic)
+
+        self._session = None
+        self._session_lock = threading.Lock()
+        # Stop waiting on timeouts while the webhook endpoint is down. Running
+        # out of the local time budget says nothing about the endpoint
+        self._breaker = CircuitBreaker(ignore=(DeadlineExceeded,))
+
+    @property
+    def backend_key(self) -> Optional[tuple[str, str]]:
+        """Webhooks are grouped by host."""
+        return ("webhook", urlsplit(self.webhook_url).netloc)
+
+    @property
+    def session(self) -> "requests.Session":
+        """Pooled HTTP session reused across notifications, created on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> "requests.Session":
+        """Create a keep-alive HTTP session for the webhook."""
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        # Retries are done by _post(), which can keep them within the deadline
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8, pool_block=False)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _post(self, payload: dict, deadline: Optional[float] = None):
+        """
+        POST a JSON payload to the webhook, raising on HTTP errors. Transient
+        failures are retried, but never past the deadline: an attempt or a
+        backoff sleep that would end after it is not started.
+        """
+        import requests
+
+        data = _json_dumps(payload)
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                response = self.session.post(
+                    self.webhook_url,
+                    data=data,
+                    headers={"Content-Type": "application/json"},
+                    timeout=self._timeout(deadline)
+                )
+            except requests.ConnectionError:
+                # No response arrived. Read timeouts are not retried: the
+                # webhook may already have the POST and would get it twice
+                delay = self._backoff(attempt)
+                if not self._can_retry(attempt, delay, deadline):
+                    raise
+            else:
+                if response.status_code not in self.RETRY_STATUSES:
+                    response.raise_for_status()
+                    return
+                delay = self._retry_after(response) or self._backoff(attempt)
+                if not self._can_retry(attempt, delay, deadline):
+                    response.raise_for_status()
+            time.sleep(delay)
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given retry attempt."""
+        return random.uniform(0, min(self.BACKOFF_MAX, self.BACKOFF_FACTOR * 2 ** attempt))
+
+    def _retry_after(self, response: "requests.Response") -> Optional[float]:
+        """Seconds to wait according to a Retry-After header, if there is one."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def _can_retry(self, attempt: int, delay: float, deadline: Optional[float]) -> bool:
+        """Whether another attempt is allowed and its backoff ends before the deadline."""
+        if attempt >= self.MAX_RETRIES:
+            return False
+        return deadline is None or time.monotonic() + delay < deadline
+
+    def _timeout(self, deadline: Optional[float]) -> tuple[float, float]:
+        """(connect, read) timeout for a request that must finish by deadline."""
+        remaining = _remaining(deadline)
+        return (min(CONNECT_TIMEOUT, remaining), remaining)
+
+    def close(self):
+        """Close the HTTP session and release pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def notify(self, change: ChangeRecord, deadline: Optional[float] = None) -> bool:
         """Send webhook notification."""
         try:
-            if self.webhook_type == "discord":
-                return self._send_discord(change)
-            elif self.webhook_type == "slack":
-                return self._send_slack(change)
-            else:
-                return self._send_generic(change)
+            _remaining(deadline)
+            with self._breaker:
+                return self._send(change, deadline)
+        except CircuitOpenError:
+            logger.warning("Webhook %s is failing, skipping notification for %s",
+                           self.webhook_type, change.site_name)
+            return False
+        except DeadlineExceeded:
+            logger.warning("Notification deadline passed before the %s webhook for %s was sent",
+                           self.webhook_type, change.site_name)
+            return False
         except Exception as e:
-            logger.error(f"Failed to send webhook notification: {e}")
+            logger.error("Failed to send webhook notification: %s", e)
             return False
 
-    def _send_discord(self, change: ChangeRecord) -> bool:
+    def _send_discord(self, change: ChangeRecord, deadline: Optional[float] = None) -> bool:
         """Send Discord webhook notification."""
         diff_preview = ""
         if change.diff:
-            diff_lines = [l for l in change.diff if l.startswith('+') or l.startswith('-')]
+            diff_lines = change.diff_changes
             diff_preview = '\n'.join(diff_lines[:20])
             if len(diff_lines) > 20:
                 diff_preview += f"\n... and {len(diff_lines) - 20} more changes"
@@ -134,19 +427,14 @@ class WebhookNotifier(Notifier):
                 "inline": False
             })
 
-        response = requests.post(
-            self.webhook_url,
-            json=payload,
-            timeout=10
-        )
-        response.raise_for_status()
+        self._post(payload, deadline)
         return True
 
-    def _send_slack(self, change: ChangeRecord) -> bool:
+    def _send_slack(self, change: ChangeRecord, deadline: Optional[float] = None) -> bool:
         """Send Slack webhook notification."""
         diff_preview = ""
         if change.diff:
-            diff_lines = [l for l in change.diff if l.startswith('+') or l.startswith('-')]
+            diff_lines = change.diff_changes
             diff_preview = '\n'.join(diff_lines[:20])
 
         blocks = [
@@ -172,15 +460,10 @@ class WebhookNotifier(Notifier):
 
         payload = {"blocks": blocks}
 
-        response = requests.post(
-            self.webhook_url,
-            json=payload,
-            timeout=10
-        )
-        response.raise_for_status()
+        self._post(payload, deadline)
         return True
 
-    def _send_generic(self, change: ChangeRecord) -> bool:
+    def _send_generic(self, change: ChangeRecord, deadline: Optional[float] = None) -> bool:
         """Send generic JSON webhook notification."""
         payload = {
             "event": "site_change",
@@ -192,109 +475,304 @@ class WebhookNotifier(Notifier):
             "diff_lines": len(change.diff) if change.diff else 0
         }
 
-        response = requests.post(
-            self.webhook_url,
-            json=payload,
-            timeout=10
-        )
-        response.raise_for_status()
+        self._post(payload, deadline)
         return True
 
 
 class EmailNotifier(Notifier):
     """Sends notifications via email."""
 
+    # Limits after which the SMTP connection is reopened
+    MAX_MESSAGES_PER_CONNECTION = 100
+    MAX_CONNECTION_AGE = 300  # seconds
+
     def __init__(self, config: EmailConfig):
         self.config = config
-
-    def notify(self, change: ChangeRecord) -> bool:
+        # One authenticated SMTP connection reused across notifications
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+        self._sent = 0
+        self._opened_at = 0.0
+
+    @property
+    def backend_key(self) -> Optional[tuple[str, str]]:
+        """Emails are grouped by SMTP server."""
+        return ("email", f"{self.config.smtp_server}:{self.config.smtp_port}")
+
+    def notify(self, change: ChangeRecord, deadline: Optional[float] = None) -> bool:
         """Send email notification."""
         try:
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = f"[Site Monitor] Change detected on {change.site_name}"
-            msg['From'] = self.config.from_addr
-            msg['To'] = self.config.to_addr
+            self._send(
+                f"[Site Monitor] Change detected on {change.site_name}",
+                "Website Change Detected!",
+                [change],
+                deadline
+            )
+
+            logger.info("Email notification sent to %s", self.config.to_addr)
+            return True
 
-            # Plain text version
-            text_content = f"""
-Website Change Detected!
+        except Exception as e:
+            logger.error("Failed to send email notification: %s", e)
+            return False
 
-Site: {change.site_name}
-URL: {change.url}
-Time: {change.timestamp}
+    def _build_message(self, subject: str, heading: str,
+                       changes: list[ChangeRecord]) -> EmailMessage:
+        """Build a plain text + HTML email with one section per change."""
+        msg = EmailMessage(policy=policy.SMTP)
+        msg['Subject'] = subject
+        msg['From'] = self.config.from_addr
+        msg['To'] = self.config.to_addr
+
+        text_content = _EMAIL_TEXT.substitute(
+            heading=heading,
+            sections=''.join(self._text_section(change) for change in changes)
+        )
+        html_content = _EMAIL_HTML.substitute(
+            heading=heading,
+            sections='<hr>'.join(self._html_section(change) for change in changes)
+        )
 
-Old Hash: {change.old_hash}
-New Hash: {change.new_hash}
+        msg.set_content(text_content)
+        msg.add_alternative(html_content, subtype='html')
+        return msg
+
+    def _text_section(self, change: ChangeRecord) -> str:
+        """Plain text description of one change."""
+        return _EMAIL_TEXT_SECTION.substitute(
+            site_name=change.site_name,
+            url=change.url,
+            timestamp=change.timestamp,
+            old_hash=change.old_hash,
+            new_hash=change.new_hash,
+            diff=''.join(change.diff[:100]) if change.diff else 'No diff available'
+        )
 
-Diff:
-{''.join(change.diff[:100]) if change.diff else 'No diff available'}
-"""
-
-            # HTML version
-            diff_html = ""
-            if change.diff:
-                diff_lines = []
-                for line in change.diff[:100]:
-                    if line.startswith('+') and not line.startswith('+++'):
-                        diff_lines.append(f'<span style="color: green;">{line}</span>')
-                    elif line.startswith('-') and not line.startswith('---'):
-                        diff_lines.append(f'<span style="color: red;">{line}</span>')
-                    else:
-                        diff_lines.append(line)
-                diff_html = '<br>'.join(diff_lines)
-
-            html_content = f"""
-<html>
-<body>
-<h2 style="color: #FF6B6B;">Website Change Detected!</h2>
-<table>
-<tr><td><strong>Site:</strong></td><td>{change.site_name}</td></tr>
-<tr><td><strong>URL:</strong></td><td><a href="{change.url}">{change.url}</a></td></tr>
-<tr><td><strong>Time:</strong></td><td>{change.timestamp}</td></tr>
-</table>
-<h3>Changes:</h3>
-<pre style="background: #f4f4f4; padding: 10px; font-family: monospace;">
-{diff_html}
-</pre>
-<p><small>Sent by Site Monitor Bot</small></p>
-</body>
-</html>
-"""
-
-            msg.attach(MIMEText(text_content, 'plain'))
-            msg.attach(MIMEText(html_content, 'html'))
-
-            with smtplib.SMTP(self.config.smtp_server, self.config.smtp_port) as server:
-                server.starttls()
-                server.login(self.config.username, self.config.password)
-                server.sendmail(
-                    self.config.from_addr,
-                    self.config.to_addr,
-                    msg.as_string()
-                )
+    def _html_section(self, change: ChangeRecord) -> str:
+        """HTML description of one change."""
+        diff_html = '<br>'.join(map(_diff_line_html, change.diff[:100])) if change.diff else ""
+        return _EMAIL_HTML_SECTION.substitute(
+            site_name=change.site_name,
+            url=change.url,
+            timestamp=change.timestamp,
+            diff=diff_html
+        )
+
+    def _send(self, subject: str, heading: str, changes: list[ChangeRecord],
+              deadline: Optional[float] = None):
+        """
+        Email changes over the shared connection, reconnecting once if it was
+        dropped. The message is only built once a connection is available, so
+        nothing is rendered when the SMTP server can't be reached.
+        """
+        with self._smtp_lock:
+            server = self._ensure_conn(deadline)
+            msg = self._build_message(subject, heading, changes)
+            try:
+                server.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                # Dropped connection (e.g. an idle timeout): retry once on a new one
+                self._close_conn()
+                try:
+                    self._ensure_conn(deadline).send_message(msg)
+                except BaseException:
+                    self._close_conn()
+                    raise
+            except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+                # The server rejected the message; the connection is still usable
+                raise
+            except BaseException:
+                # The connection is in an unknown state, e.g. after a timeout
+                self._close_conn()
+                raise
+            self._sent += 1
+
+    def _ensure_conn(self, deadline: Optional[float] = None) -> smtplib.SMTP:
+        """Return a live, authenticated SMTP connection, opening a new one if needed."""
+        timeout = _remaining(deadline)
+        if self._smtp is not None:
+            expired = (self._sent >= self.MAX_MESSAGES_PER_CONNECTION or
+                       time.monotonic() - self._opened_at > self.MAX_CONNECTION_AGE)
+            # smtplib drops the socket when it notices the server hung up
+            if not expired and self._smtp.sock is not None:
+                try:
+                    self._smtp.sock.settimeout(timeout)
+                    if self._smtp.noop()[0] == 250:
+                        return self._smtp
+                except (smtplib.SMTPException, OSError):
+                    pass
+            self._close_conn()
+
+        server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port, timeout=timeout)
+        try:
+            server.starttls()
+            server.login(self.config.username, self.config.password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        self._sent = 0
+        self._opened_at = time.monotonic()
+        return server
+
+    def _close_conn(self):
+        """Close the SMTP connection, ignoring errors from a dead socket."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    def close(self):
+        """Close the SMTP connection."""
+        with self._smtp_lock:
+            self._close_conn()
+
+
+class BatchingEmailNotifier(EmailNotifier):
+    """
+    Collects changes and emails them together, flushing every `window` seconds
+    or as soon as `max_alerts` changes are waiting, and once more on close.
+    """
+
+    def __init__(self, config: EmailConfig, window: float = 60.0, max_alerts: int = 20):
+        super().__init__(config)
+        self.window = window
+        self.max_alerts = max_alerts
+        self._buffer: deque[ChangeRecord] = deque()
+        self._buffer_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+
+    def notify(self, change: ChangeRecord, deadline: Optional[float] = None) -> bool:
+        """Queue a change for the next batch. Returns True once queued."""
+        with self._buffer_lock:
+            self._buffer.append(change)
+            full = len(self._buffer) >= self.max_alerts
+            if self._timer is None:
+                self._timer = threading.Thread(target=self._run, name="email-batch", daemon=True)
+                self._timer.start()
+        if full:
+            return self._flush(deadline)
+        return True
 
-            logger.info(f"Email notification sent to {self.config.to_addr}")
+    def _run(self):
+        """Flush the buffer every window seconds until closed."""
+        while not self._stop.wait(self.window):
+            self._flush()
+
+    def _flush(self, deadline: Optional[float] = None) -> bool:
+        """Send all queued changes as one email."""
+        with self._buffer_lock:
+            changes = list(self._buffer)
+            self._buffer.clear()
+        if not changes:
+            return True
+        if len(changes) == 1:
+            return super().notify(changes[0], deadline)
+
+        try:
+            sites = ", ".join(dict.fromkeys(change.site_name for change in changes))
+            self._send(
+                f"[Site Monitor] {len(changes)} changes detected on {sites}",
+                f"{len(changes)} Website Changes Detected!",
+                changes,
+                deadline
+            )
+
+            logger.info("Email with %d changes sent to %s", len(changes), self.config.to_addr)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to send email notification: {e}")
+            logger.error("Failed to send batched email notification: %s", e)
             return False
 
+    def close(self):
+        """Stop the flush timer, send what is still queued and close the connection."""
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.join()
+        self._flush()
+        super().close()
+
 
 class NotificationManager:
     """Manages multiple notifiers."""
 
-    def __init__(self):
+    def __init__(self, max_workers: int = 8, max_per_backend: int = 4,
+                 timeout: float = 30.0):
         self.notifiers: list[Notifier] = []
+        # Total time budget for delivering one change to every notifier; each
+        # request and retry is given what is left of it, and notify_all stops
+        # waiting once it is spent
+        self.timeout = timeout
+        # Notifiers are I/O bound, so they are dispatched side by side and a
+        # slow SMTP server no longer delays the webhooks
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="notifier"
+        )
+        # Bound in-flight calls per (type, host) so bursts of changes stay
+        # within provider rate and connection limits
+        self.max_per_backend = max_per_backend
+        self._bulkheads: dict[tuple[str, str], threading.BoundedSemaphore] = {}
+        self._bulkheads_lock = threading.Lock()
 
     def add_notifier(self, notifier: Notifier):
         """Add a notifier."""
         self.notifiers.append(notifier)
 
     def notify_all(self, change: ChangeRecord):
-        """Send notification to all registered notifiers."""
-        for notifier in self.notifiers:
+        """Send notification to all registered notifiers concurrently."""
+        deadline = time.monotonic() + self.timeout
+        submit, notify, bulkhead = self._executor.submit, self._notify, self._bulkhead
+        # Notifiers that don't want this change never build a payload
+        futures = [submit(notify, notifier, bulkhead(notifier), change, deadline)
+                   for notifier in self.notifiers
+                   if notifier.should_notify(change)]
+        _, not_done = concurrent.futures.wait(futures, timeout=self.timeout)
+        if not_done:
+            logger.warning("%d notifier(s) still running after %ss for %s",
+                           len(not_done), self.timeout, change.site_name)
+
+    def _bulkhead(self, notifier: Notifier) -> Optional[threading.BoundedSemaphore]:
+        """Get the semaphore bounding calls to a notifier's backend."""
+        key = notifier.backend_key
+        if key is None:
+            return None
+        bulkhead = self._bulkheads.get(key)
+        if bulkhead is None:
+            with self._bulkheads_lock:
+                bulkhead = self._bulkheads.get(key)
+                if bulkhead is None:
+                    bulkhead = threading.BoundedSemaphore(self.max_per_backend)
+                    self._bulkheads[key] = bulkhead
+        return bulkhead
+
+    def _notify(self, notifier: Notifier, bulkhead: Optional[threading.BoundedSemaphore],
+                change: ChangeRecord, deadline: Optional[float] = None):
+        """Send one notification, logging failures."""
+        try:
+            if bulkhead is None:
+                notifier.notify(change, deadline)
+                return
+            # Wait for a free slot only as long as the deadline allows
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not bulkhead.acquire(timeout=timeout):
+                logger.warning("Skipping %s for %s: deadline passed while waiting for %s",
+                               notifier.__class__.__name__, change.site_name,
+                               notifier.backend_key[1])
+                return
             try:
-                notifier.notify(change)
-            except Exception as e:
-                logger.error(f"Notifier {notifier.__class__.__name__} failed: {e}")
+                notifier.notify(change, deadline)
+            finally:
+                bulkhead.release()
+        except Exception as e:
+            logger.error("Notifier %s failed: %s", notifier.__class__.__name__, e)
+
+    def close(self):
+        """Release resources held by all notifiers."""
+        self._executor.shutdown(wait=True)
+        for notifier in self.notifiers:
+            notifier.close()